@@ -10,17 +10,37 @@ Usage:
     python scripts/render_resume.py --template templates/resume.tex.j2 --output resume.tex
 """
 
+import functools
 import json
+import logging
+import mmap
+import os
 import re
+import stat
 import sys
+import tempfile
 from pathlib import Path
 
 try:
-    from jinja2 import Environment, FileSystemLoader, TemplateError
+    from jinja2 import (
+        Environment,
+        FileSystemBytecodeCache,
+        FileSystemLoader,
+        TemplateError,
+    )
 except ImportError:
     print("Error: Jinja2 is required. Install it with: pip install jinja2")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# main() logs progress to stdout; when imported, warnings and errors
+# still reach stderr through logging's last-resort handler
+logger = logging.getLogger(__name__)
+
 
 # Paths relative to script location (assuming scripts/render_resume.py)
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -29,12 +49,52 @@ DATA_DIR = PROJECT_ROOT / "data"
 TEMPLATE_DIR = PROJECT_ROOT / "templates"
 TEMPLATE_FILE = "resume.tex.j2"
 OUTPUT_FILE = "resume.tex" # Output to root of the project
+JINJA_CACHE_DIR = PROJECT_ROOT / ".jinja_cache"
+MMAP_THRESHOLD = 64 * 1024  # Map config files larger than this instead of reading
+
+# Mode open() gives new files under the current umask. Reading the umask
+# means setting it, so do it once at import rather than per render.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+NEW_FILE_MODE = 0o666 & ~_UMASK
+
+
+# LaTeX special characters and their escaped forms
+_LATEX_ESCAPE_TABLE = {
+    "\\": r"\textbackslash{}",
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+    "<": r"\textless{}",
+    ">": r"\textgreater{}",
+}
+_LATEX_ESCAPE_RE = re.compile("[" + re.escape("".join(_LATEX_ESCAPE_TABLE)) + "]")
+
+# Config keys holding URLs/addresses that must stay raw (e.g. for \href)
+_RAW_KEYS = frozenset({
+    "avatar", "email", "github", "image",
+    "linkedin", "liveUrl", "logo", "website",
+})
+
+_MONTHS = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
 
 
 def latex_escape(text: str) -> str:
     """
     Escape special LaTeX characters in text.
     
+    All special characters are replaced in a single pass, so the
+    replacements themselves are never escaped again.
+    
     Args:
         text: Raw text that may contain LaTeX special characters
         
@@ -44,43 +104,36 @@ def latex_escape(text: str) -> str:
     if not text:
         return ""
     
-    # Order matters: escape backslash first, then others
-    replacements = [
-        ("\\", r"\textbackslash{}"),
-        ("&", r"\&"),
-        ("%", r"\%"),
-        ("$", r"\$"),
-        ("#", r"\#"),
-        ("_", r"\_"),
-        ("{", r"\{"),
-        ("}", r"\}"),
-        ("~", r"\textasciitilde{}"),
-        ("^", r"\textasciicircum{}"),
-        ("<", r"\textless{}"),
-        (">", r"\textgreater{}"),
-    ]
-    
-    result = text
-    for char, escaped in replacements:
-        result = result.replace(char, escaped)
-    
-    return result
+    # Most fields contain no specials; return them untouched. A regex
+    # search is cheaper here than a str.translate probe, which has to
+    # allocate a copy of the string even when nothing matches.
+    if not _LATEX_ESCAPE_RE.search(text):
+        return text
+    
+    return _LATEX_ESCAPE_RE.sub(lambda m: _LATEX_ESCAPE_TABLE[m.group(0)], text)
+
+
+def _url_segment_after(url: str, prefix: str) -> str:
+    """Return the path segment following prefix in url, or url itself."""
+    _, found, rest = url.partition(prefix)
+    segment = rest.split("/", 1)[0]
+    return segment if found and segment else url
 
 
+@functools.lru_cache(maxsize=32)
 def github_username(url: str) -> str:
     """Extract GitHub username from URL."""
     if not url:
         return ""
-    match = re.search(r"github\.com/([^/]+)", url)
-    return match.group(1) if match else url
+    return _url_segment_after(url, "github.com/")
 
 
+@functools.lru_cache(maxsize=32)
 def linkedin_username(url: str) -> str:
     """Extract LinkedIn username from URL."""
     if not url:
         return ""
-    match = re.search(r"linkedin\.com/in/([^/]+)", url)
-    return match.group(1) if match else url
+    return _url_segment_after(url, "linkedin.com/in/")
 
 
 def join_tech(technologies: list) -> str:
@@ -88,56 +141,100 @@ def join_tech(technologies: list) -> str:
     if not technologies:
         return ""
     # Handle both {"name": "Tech"} objects and plain strings
-    names = []
-    for tech in technologies:
-        if isinstance(tech, dict):
-            names.append(tech.get("name", ""))
-        else:
-            names.append(str(tech))
+    names = (
+        tech.get("name", "") if isinstance(tech, dict) else str(tech)
+        for tech in technologies
+    )
     return ", ".join(filter(None, names))
 
 
+def _format_month_year(date_str: str) -> str:
+    """Format a "YYYY-MM[-DD]" date as e.g. "Jan 2025"."""
+    # Slice zero-padded ISO dates directly; split anything else
+    # (e.g. unpadded "2021-6-01")
+    if (
+        len(date_str) >= 7
+        and date_str[4] == "-"
+        and date_str[:4].isdigit()
+        and date_str[5:7].isdigit()
+    ):
+        year, month = date_str[:4], int(date_str[5:7])
+    else:
+        year, month = date_str.split("-")[:2]
+        year, month = int(year), int(month)
+    
+    if not 1 <= month <= 12:
+        raise ValueError(f"month out of range in {date_str!r}")
+    return f"{_MONTHS[month - 1]} {year}"
+
+
 def format_duration(start_date: str, end_date: str | None = None) -> str:
     """
     Format duration string from startDate and endDate.
     e.g., "Jan 2025 – Present" or "May 2022 – Aug 2024"
     """
-    months = [
-        "Jan", "Feb", "Mar", "Apr", "May", "Jun",
-        "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"
-    ]
-    
-    def format_date(date_str: str) -> str:
-        parts = date_str.split("-")
-        year = int(parts[0])
-        month = int(parts[1])
-        return f"{months[month - 1]} {year}"
-    
-    start = format_date(start_date)
-    end = format_date(end_date) if end_date else "Present"
+    start = _format_month_year(start_date)
+    end = _format_month_year(end_date) if end_date else "Present"
     
     return f"{start} -- {end}"
 
 
+def escape_config(value):
+    """
+    Recursively LaTeX-escape every string in loaded config data.
+    
+    Strings under keys in _RAW_KEYS are left as-is.
+    """
+    if isinstance(value, str):
+        return latex_escape(value)
+    if isinstance(value, dict):
+        return {
+            k: v if k in _RAW_KEYS else escape_config(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [escape_config(v) for v in value]
+    return value
+
+
 def load_json_file(filepath: Path) -> dict:
-    """Load and parse a JSON file."""
+    """
+    Load and parse a JSON file (using orjson when available).
+    
+    With orjson, large files are parsed straight from a memory map
+    instead of being copied into a bytes object first.
+    
+    Raises:
+        ValueError: If the file does not contain valid JSON
+    """
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(filepath, "rb") as f:
+            if orjson and os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+            data = f.read()
+        return orjson.loads(data) if orjson else json.loads(data)
     except FileNotFoundError:
-        print(f"Warning: Config file not found: {filepath}")
+        logger.warning("Warning: Config file not found: %s", filepath)
         return {}
     except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON in {filepath}: {e}")
-        sys.exit(1)
+        raise ValueError(f"Invalid JSON in {filepath}: {e}") from e
 
 
 def load_all_configs(data_dir: Path) -> dict:
     """
     Load all JSON config files and merge into a single context.
     
+    String values are LaTeX-escaped once here, so the template can
+    output them directly.
+    
     Returns:
         Dictionary with all config data merged for template rendering
+        
+    Raises:
+        ValueError: If a config file is not valid JSON, or an experience
+            entry has a missing or malformed date
     """
     context = {}
     
@@ -152,10 +249,15 @@ def load_all_configs(data_dir: Path) -> dict:
         "seo": "seo.json",
     }
     
+    # List the data directory once instead of stat-ing each file
+    try:
+        present = set(os.listdir(data_dir))
+    except FileNotFoundError:
+        present = set()
+    
     for key, filename in config_files.items():
-        filepath = data_dir / filename
-        if filepath.exists():
-            context[key] = load_json_file(filepath)
+        if filename in present:
+            context[key] = escape_config(load_json_file(data_dir / filename))
     
     # Flatten nested structures for easier template access
     # Experience: experience_data.experience -> experience
@@ -174,6 +276,31 @@ def load_all_configs(data_dir: Path) -> dict:
     if "education_data" in context and "education" in context["education_data"]:
         context["education"] = context["education_data"]["education"]
     
+    # Pre-compute derived fields once so the template doesn't run
+    # filters on every render
+    for job in context.get("experience", []):
+        company = job.get("company", "<unknown>")
+        if not job.get("startDate"):
+            raise ValueError(f"Experience entry {company!r} has no startDate")
+        try:
+            job["duration"] = format_duration(job["startDate"], job.get("endDate"))
+        except (ValueError, IndexError, TypeError) as e:
+            raise ValueError(
+                f"Experience entry {company!r} has an invalid date: {e}"
+            ) from e
+    
+    for project in context.get("projects", []):
+        project["tech_str"] = join_tech(project.get("technologies", []))
+    
+    if "profile" in context:
+        socials = context["profile"].get("socials", {})
+        context["profile"]["github_username"] = latex_escape(
+            github_username(socials.get("github", ""))
+        )
+        context["profile"]["linkedin_username"] = latex_escape(
+            linkedin_username(socials.get("linkedin", ""))
+        )
+    
     return context
 
 
@@ -184,8 +311,11 @@ def create_jinja_env(template_dir: Path) -> Environment:
     Uses (( )) for blocks and ((= =)) for variables to avoid
     conflicts with LaTeX's { } syntax.
     """
+    JINJA_CACHE_DIR.mkdir(exist_ok=True)
+    
     env = Environment(
-        loader=FileSystemLoader(template_dir),
+        loader=FileSystemLoader(str(template_dir)),
+        bytecode_cache=FileSystemBytecodeCache(directory=str(JINJA_CACHE_DIR)),
         block_start_string="((",
         block_end_string="))",
         variable_start_string="((=",
@@ -196,8 +326,9 @@ def create_jinja_env(template_dir: Path) -> Environment:
         lstrip_blocks=True,
     )
     
-    # Register custom filters
-    env.filters["latex_escape"] = latex_escape
+    # Register custom filters. Config strings are escaped at load time;
+    # latex_escape_raw is only for raw URL/email fields shown as text.
+    env.filters["latex_escape_raw"] = latex_escape
     env.filters["github_username"] = github_username
     env.filters["linkedin_username"] = linkedin_username
     env.filters["join_tech"] = join_tech
@@ -206,11 +337,24 @@ def create_jinja_env(template_dir: Path) -> Environment:
     return env
 
 
+# Environments shared across renders, keyed by template directory
+_ENV_CACHE: dict[Path, Environment] = {}
+
+
+def _get_env(template_dir: Path) -> Environment:
+    """Return the shared Jinja2 environment for template_dir, creating it once."""
+    env = _ENV_CACHE.get(template_dir)
+    if env is None:
+        env = _ENV_CACHE[template_dir] = create_jinja_env(template_dir)
+    return env
+
+
 def render_resume(
     template_dir: Path = TEMPLATE_DIR,
     template_file: str = TEMPLATE_FILE,
     output_file: str = OUTPUT_FILE,
     data_dir: Path = DATA_DIR,
+    env: Environment | None = None,
 ) -> bool:
     """
     Render the resume template with config data.
@@ -220,56 +364,100 @@ def render_resume(
         template_file: Name of the Jinja2 template file
         output_file: Name of the output .tex file
         data_dir: Directory containing JSON config files
+        env: Jinja2 environment to use; defaults to a shared environment
+            for template_dir, so repeated renders reuse compiled templates
         
     Returns:
         True if rendering succeeded, False otherwise
     """
-    print(f"Loading config files from: {data_dir}")
-    context = load_all_configs(data_dir)
+    # Resolve paths once up front
+    template_path = str(template_dir / template_file)
+    output_path = str(PROJECT_ROOT / output_file)
+    
+    logger.info("Loading config files from: %s", data_dir)
+    try:
+        context = load_all_configs(data_dir)
+    except ValueError as e:
+        logger.error("Error: %s", e)
+        return False
     
     # Validate required data
     required_keys = ["profile", "experience", "education"]
     missing = [k for k in required_keys if k not in context or not context[k]]
     if missing:
-        print(f"Error: Missing required config data: {', '.join(missing)}")
+        logger.error("Error: Missing required config data: %s", ", ".join(missing))
         return False
     
-    print(f"Loaded configs: {list(context.keys())}")
+    logger.info("Loaded configs: %s", list(context.keys()))
     
     # Create Jinja environment and load template
-    print(f"Loading template: {template_dir / template_file}")
-    env = create_jinja_env(template_dir)
+    logger.info("Loading template: %s", template_path)
+    if env is None:
+        env = _get_env(template_dir)
     
     try:
         template = env.get_template(template_file)
     except TemplateError as e:
-        print(f"Error loading template: {e}")
+        logger.error("Error loading template: %s", e)
         return False
     
-    # Render template
+    # Render template, streaming chunks into a temp file next to the
+    # output so a failed render never clobbers the last good output
+    logger.info("Writing output to: %s", output_path)
+    
+    # Write through symlinks and keep an existing file's mode, as
+    # open(output_path, "w") would
+    target_path = os.path.realpath(output_path)
     try:
-        rendered = template.render(**context)
-    except TemplateError as e:
-        print(f"Error rendering template: {e}")
-        return False
+        target_mode = stat.S_IMODE(os.stat(target_path).st_mode)
+    except FileNotFoundError:
+        target_mode = NEW_FILE_MODE
     
-    # Write output
-    output_path = PROJECT_ROOT / output_file
-    print(f"Writing output to: {output_path}")
+    try:
+        tmp = tempfile.NamedTemporaryFile(
+            mode="wb",
+            dir=os.path.dirname(target_path),
+            prefix=".resume-",
+            suffix=".tmp",
+            delete=False,
+        )
+    except IOError as e:
+        logger.error("Error writing output file: %s", e)
+        return False
     
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(rendered)
+        with tmp:
+            stream = template.stream(**context)
+            stream.enable_buffering(size=5)
+            stream.dump(tmp, encoding="utf-8")
+        # NamedTemporaryFile is created 0600
+        os.chmod(tmp.name, target_mode)
+        os.replace(tmp.name, target_path)
+    except TemplateError as e:
+        logger.error("Error rendering template: %s", e)
+        return False
     except IOError as e:
-        print(f"Error writing output file: {e}")
+        logger.error("Error writing output file: %s", e)
         return False
+    finally:
+        # No-op after a successful replace
+        Path(tmp.name).unlink(missing_ok=True)
     
-    print("Resume template rendered successfully!")
+    logger.info("Resume template rendered successfully!")
     return True
 
 
 def main():
     """Main entry point."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    
+    # No arguments: render with the defaults without building a parser
+    if len(sys.argv) == 1:
+        sys.exit(0 if render_resume() else 1)
+    
     import argparse
     
     parser = argparse.ArgumentParser(